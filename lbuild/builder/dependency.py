@@ -51,9 +51,9 @@ def graphviz(builder, selected_modules, depth, clustered=None):
             if clustered:
                 # Remove the repository name for the clusted output. The
                 # repository name is mentioned in the cluster already.
-                name = ":\\n".join(module.fullname.split(":")[1:])
+                name = ":\\n".join(module.fullname_parts[1:])
             else:
-                name = ":\\n".join(module.fullname.split(":"))
+                name = ":\\n".join(module.fullname_parts)
 
             attributes = []
             attributes.append("label=\"{}\"".format(name))
@@ -30,6 +30,8 @@ class Operation:
     Stores the connection between a generated file and its template and module
     from within it was generated.
     """
+    __slots__ = ("module_name", "time", "metadata", "outpath", "inpath",
+                 "filename_in", "filename_out")
 
     def __init__(self, module_name, outpath, module_path,
                  filename_in: str, filename_out: str, time=None, metadata=None):
@@ -107,7 +109,7 @@ class BuildLog:
         metadata = collections.defaultdict(lambda: collections.defaultdict(set))
         for key, data in self._metadata.items():
             for module, value in data.items():
-                metadata[key][module.split(":")[0]] |= value
+                metadata[key][module.partition(":")[0]] |= value
 
         for key in metadata:
             for repo in metadata[key]:
@@ -204,7 +206,7 @@ class BuildLog:
 
     @property
     def repositories(self):
-        return list(set(m.split(":")[0] for m in self.modules))
+        return list(set(m.partition(":")[0] for m in self.modules))
 
     @property
     def modules(self):
@@ -263,3 +265,19 @@ class BuildLog:
                                        pretty_print=True,
                                        xml_declaration=True,)
         return rootnode
+
+    def to_xml_stream(self, fileobj, path):
+        """
+        Write the XML representation of the build log directly into a file.
+
+        Avoids materializing the serialized XML in memory first.
+
+        Args:
+            fileobj: File object opened in binary mode.
+            path: Path to which all filenames are made relative.
+        """
+        rootnode = self.to_xml(path, to_string=False)
+        lxml.etree.ElementTree(rootnode).write(fileobj,
+                                               encoding="UTF-8",
+                                               pretty_print=True,
+                                               xml_declaration=True,)
@@ -7,7 +7,7 @@
 # 2-clause BSD license. See the file `LICENSE.txt` for the full license
 # governing this code.
 
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 
 from .format import ColorWrapper as _cw
 from .node import BaseNode
@@ -16,13 +16,15 @@ import lbuild.utils
 
 
 class CollectorContext:
+    __slots__ = ("module", "filename")
+
     def __init__(self, module, filename=None):
         self.module = module
         self.filename = filename
 
     @property
     def repository(self):
-        return self.module.split(":")[0]
+        return self.module.partition(":")[0]
 
     @property
     def has_filename(self):
@@ -13,6 +13,8 @@ import os
 from os.path import realpath, join
 import glob
 import re
+import copy
+import functools
 import pkgutil
 import logging
 import collections
@@ -256,14 +258,12 @@ class ConfigNode(anytree.AnyNode):
     @staticmethod
     def _load_and_verify(configfile):
         try:
-            xmlroot = lxml.etree.parse(str(configfile))
-
-            xmlschema = lxml.etree.fromstring(
-                pkgutil.get_data('lbuild', 'resources/configuration.xsd'))
-            schema = lxml.etree.XMLSchema(xmlschema)
-            schema.assertValid(xmlroot)
-
-            xmltree = xmlroot.getroot()
+            filename = realpath(str(configfile))
+            stat = os.stat(filename)
+            xmltree = ConfigNode._load_and_verify_cached(filename, stat.st_mtime_ns, stat.st_size)
+            # The tree is modified during the environment substitution,
+            # therefore the cached version must not be handed out.
+            xmltree = copy.deepcopy(xmltree)
         except OSError as error:
             raise LbuildConfigException(configfile, error)
         except (lxml.etree.DocumentInvalid,
@@ -275,6 +275,24 @@ class ConfigNode(anytree.AnyNode):
             raise LbuildConfigException(configfile, ": Validation failed!\n\n{}".format(error))
         return xmltree
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _schema():
+        xmlschema = lxml.etree.fromstring(
+            pkgutil.get_data('lbuild', 'resources/configuration.xsd'))
+        return lxml.etree.XMLSchema(xmlschema)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_and_verify_cached(filename, mtime, size):
+        """
+        Parse and validate a configuration file only once per modification.
+        """
+        # pylint: disable=unused-argument
+        xmlroot = lxml.etree.parse(filename)
+        ConfigNode._schema().assertValid(xmlroot)
+        return xmlroot.getroot()
+
     @staticmethod
     def _substitute_env(configfile, root, env={}):
         for i, node in enumerate(root):
@@ -16,8 +16,6 @@ import zipfile
 import tarfile
 import tempfile
 
-import jinja2
-
 import lbuild.utils
 
 import lbuild.facade as lf
@@ -110,6 +108,7 @@ class Environment:
         self.outbasepath = None
         self.substitutions = {}
         self.stage = Parser.Stage.INIT
+        self.__facades = {}
 
     @property
     def queries(self):
@@ -261,7 +260,6 @@ class Environment:
                 dest = src
 
         srcpath = os.path.normpath(src if os.path.isabs(src) else self.modulepath(src))
-        destpath = os.path.normpath(dest if os.path.isabs(dest) else self.outpath(dest))
         srcrelpath = self.repopath(srcpath)
         if srcrelpath.startswith(".."):
             raise le.LbuildEnvironmentFileOutsideRepositoryException(self.__module, srcpath)
@@ -395,11 +393,17 @@ class Environment:
 
     @property
     def facade(self):
-        if self.stage == Parser.Stage.BUILD:
-            return lf.EnvironmentBuildFacade(self)
-        if self.stage == Parser.Stage.POST_BUILD:
-            return lf.EnvironmentPostBuildFacade(self)
-        return lf.EnvironmentValidateFacade(self)
+        # The facades are stateless, so create only one per stage
+        facade = self.__facades.get(self.stage)
+        if facade is None:
+            if self.stage == Parser.Stage.BUILD:
+                facade = lf.EnvironmentBuildFacade(self)
+            elif self.stage == Parser.Stage.POST_BUILD:
+                facade = lf.EnvironmentPostBuildFacade(self)
+            else:
+                facade = lf.EnvironmentValidateFacade(self)
+            self.__facades[self.stage] = facade
+        return facade
 
     @property
     def facade_buildlog(self):
@@ -412,6 +416,8 @@ class Environment:
             return
 
         self.__template_environment_filters = filters
+        # Only needed for templates, so do not slow down the startup
+        import jinja2
 
         # Overwrite jinja2 Environment in order to enable relative paths
         # since this runs locally that should not be a security concern
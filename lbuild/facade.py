@@ -421,6 +421,7 @@ class CollectorFacade:
 
 
 class BuildLogOperationFacade:
+    __slots__ = ("_operation", "has_filename")
 
     def __init__(self, operation):
         self._operation = operation
@@ -428,7 +429,7 @@ class BuildLogOperationFacade:
 
     @property
     def repository(self):
-        return self.module.split(":")[0]
+        return self.module.partition(":")[0]
 
     @property
     def module(self):
@@ -9,8 +9,9 @@
 # governing this code.
 
 import os
-import sys
 import shutil
+import operator
+import functools
 import anytree
 
 import lbuild.node
@@ -40,27 +41,28 @@ COLOR_SCHEME = {
 }
 
 
+ANSI_STYLES = {
+    "reset": "\033[0m",
+    "bold": "\033[1m",
+    "underlined": "\033[4m",
+    "no_bold": "\033[22m",
+    "no_underlined": "\033[24m",
+    "close_fg_color": "\033[39m",
+}
+
+
 def ansi_escape(obj=None):
     if PLAIN:
         # The terminal does not support color
         return ""
 
-    COLORFUL_REPLACEMENT = {
-        "reset": "\033[0m",
-        "bold": "\033[1m",
-        "underlined": "\033[4m",
-        "no_bold": "\033[22m",
-        "no_underlined": "\033[24m",
-        "close_fg_color": "\033[39m",
-    }
-
     name = obj
     if isinstance(obj, lbuild.node.BaseNode):
         name = obj.type.name.lower()
 
     col = COLOR_SCHEME.get(name, "nope")
     if col == "nope":
-        col = COLORFUL_REPLACEMENT.get(name, None)
+        col = ANSI_STYLES.get(name, None)
 
     return str(col) if col is not None else ""
 
@@ -233,6 +235,12 @@ def format_description(node, description):
 
 
 def format_short_description(_, description):
+    return _format_short_description(description)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_short_description(description):
+    # Only depends on the description, which is formatted on every tree render
     lines = description.strip().splitlines() + [""]
     return lines[0].strip().rstrip(".,:;!?")
 
@@ -287,14 +295,11 @@ def format_node_tree(node, filterfunc=None):
     if filterfunc is None:
         filterfunc = lambda n: n.type in SHOW_NODES and not n.name.startswith("__")
 
+    sort_key = operator.attrgetter("_type", "name")
     def childiter(nodes):
-        nodes = [n for n in nodes if filterfunc(n)]
-        return sorted(nodes, key=lambda node: (node._type, node.name))
+        return sorted(filter(filterfunc, nodes), key=sort_key)
 
     depth = node.depth
     render = anytree.RenderTree(node, childiter=childiter,
                                 style=anytree.ContRoundStyle())
-    lines = []
-    for pre, _, node in render:
-        lines.append(pre + format_node(node, pre, depth))
-    return "\n".join(lines)
+    return "\n".join(pre + format_node(node, pre, depth) for pre, _, node in render)
@@ -13,8 +13,6 @@ import os
 import re
 import sys
 import argparse
-import traceback
-import textwrap
 
 import lbuild.logger
 import lbuild.vcs.common
@@ -168,7 +166,8 @@ class DiscoverOptionsAction(ManipulationActionBase):
             ostream.append(format_option_short_description(option))
             if option.short_description:
                 ostream.append("")
-                ostream.append(textwrap.indent(option.short_description, "  "))
+                ostream.extend("  " + line if line.strip() else line
+                               for line in option.short_description.splitlines())
             ostream.append("")
 
         return "\n".join(ostream)
@@ -197,7 +196,7 @@ class SearchAction(ManipulationActionBase):
 
         search = "|".join(args.queries)
         fnodes = []
-        ostream = ""
+        ostream = []
         lbuild.format.PLAIN = True
 
         for node in nodes:
@@ -211,14 +210,15 @@ class SearchAction(ManipulationActionBase):
 
             if olines:
                 fnodes.append(node)
-                ostream += "\n\n\n" + description[0]
+                ostream.append("\n\n\n" + description[0])
                 if olines[0].startswith(" -1  >> "):
                     olines = olines[1:]
                 if olines:
-                    ostream += "\n\n" + "\n".join(olines)
+                    ostream.append("\n\n" + "\n".join(olines))
 
         tnodes = {a  for n in fnodes  for a in n.ancestors} | set(fnodes)
-        ostream = builder.parser.render(lambda n: n.type in show_nodes and n in tnodes) + ostream
+        ostream.insert(0, builder.parser.render(lambda n: n.type in show_nodes and n in tnodes))
+        ostream = "".join(ostream)
 
         if not plain:
             lbuild.format.PLAIN = False
@@ -320,17 +320,14 @@ class BuildAction(ManipulationActionBase):
                                  use_symlinks=args.symlink)
 
         if args.simulate:
-            ostream = []
-            for operation in buildlog.operations:
-                ostream.append(operation.local_filename_out())
-            return "\n".join(sorted(ostream))
+            return "\n".join(sorted(op.local_filename_out() for op in buildlog.operations))
 
         if args.buildlog:
             configfilename = args.config
             logfilename = configfilename + ".log"
             buildlog.log_unsafe("lbuild", "buildlog.xml.in", logfilename)
             with open(logfilename, "wb") as logfile:
-                logfile.write(buildlog.to_xml(to_string=True, path=os.getcwd()))
+                buildlog.to_xml_stream(logfile, path=os.getcwd())
 
         return ""
 
@@ -348,6 +345,13 @@ class CleanAction(ManipulationActionBase):
             help="Use the given buildlog to identify the files to remove.")
         parser.set_defaults(execute_action=self.perform)
 
+    @staticmethod
+    def _remove_file(filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
     @staticmethod
     def perform(args, builder):
         ostream = []
@@ -359,19 +363,31 @@ class CleanAction(ManipulationActionBase):
             buildlog = builder.build(args.path, simulate=True)
 
         dirs = set()
-        filenames = [op.local_filename_out() for op in buildlog.operations]
-        for filename in sorted(filenames):
+        filenames = sorted(op.local_filename_out() for op in buildlog.operations)
+        for filename in filenames:
             ostream.append("Removing " + filename)
-            dirs.add(os.path.dirname(filename))
-            try:
-                os.remove(filename)
-            except OSError:
-                pass
-
-        dirs = sorted(list(dirs), key=lambda d: d.count("/"), reverse=True)
-        for directory in dirs:
+            # Collect the entire parent chain once, instead of letting
+            # os.removedirs() walk it again for every directory.
+            # The filenames are normalized, so splitting at the native
+            # separator is sufficient and cheaper than os.path.dirname().
+            directory = filename.rpartition(os.sep)[0]
+            while directory and directory not in dirs:
+                dirs.add(directory)
+                directory = directory.rpartition(os.sep)[0]
+
+        # Only needed for cleaning, so do not slow down the startup
+        import concurrent.futures
+        # Each unlink releases the GIL, so removing many files concurrently
+        # hides the syscall latency of slow (network) filesystems.
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results, so that unexpected errors are raised
+            list(executor.map(CleanAction._remove_file, filenames))
+
+        # Directories must be removed serially from the deepest one upwards
+        for directory in sorted(dirs, key=lambda d: d.count(os.sep), reverse=True):
             try:
-                os.removedirs(directory)
+                os.rmdir(directory)
             except OSError:
                 pass
 
@@ -414,6 +430,22 @@ class DependenciesAction(ManipulationActionBase):
         return dot_file
 
 
+# The actions are stateless and can be shared between argument parsers
+_ACTIONS = (
+    DiscoverAction(),
+    DiscoverOptionsAction(),
+    SearchAction(),
+
+    ValidateAction(),
+    BuildAction(),
+    CleanAction(),
+
+    InitAction(),
+    UpdateAction(),
+    DependenciesAction(),
+)
+
+
 def prepare_argument_parser():
     """
     Set up the argument parser for the different commands.
@@ -422,7 +454,8 @@ def prepare_argument_parser():
     Configured ArgumentParser object.
     """
     argument_parser = argparse.ArgumentParser(
-        description='Build source code libraries from modules.')
+        description='Build source code libraries from modules.',
+        fromfile_prefix_chars='@')
     argument_parser.add_argument(
         '-r',
         '--repository',
@@ -495,20 +528,7 @@ def prepare_argument_parser():
         title="Actions",
         dest="action")
 
-    actions = [
-        DiscoverAction(),
-        DiscoverOptionsAction(),
-        SearchAction(),
-
-        ValidateAction(),
-        BuildAction(),
-        CleanAction(),
-
-        InitAction(),
-        UpdateAction(),
-        DependenciesAction(),
-    ]
-    for action in actions:
+    for action in _ACTIONS:
         action.register(subparsers)
 
     return argument_parser
@@ -551,6 +571,7 @@ def main():
     except lbuild.exception.LbuildException as error:
         sys.stderr.write('\nERROR: {}\n'.format(error))
         if args.verbose >= 1:
+            import traceback
             traceback.print_exc()
         sys.exit(1)
 
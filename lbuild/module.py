@@ -10,6 +10,7 @@
 # governing this code.
 
 import os
+import sys
 import logging
 import inspect
 
@@ -22,65 +23,89 @@ from .node import BaseNode
 
 LOGGER = logging.getLogger('lbuild.module')
 
+# Marks modules which have been loaded, but are not available
+NOT_AVAILABLE = object()
+
+REQUIRED_FUNCTIONS = ('init', 'prepare', 'build')
+OPTIONAL_FUNCTIONS = ('pre_build', 'validate', 'post_build')
+
 
 class ModuleBase:
     pass
 
 
 def load_module_from_file(repository, filename, parent=None):
+    return _init_module_from_file(repository, filename, parent).prepare()
+
+
+def load_module_from_object(repository, module_obj, filename, parent=None):
+    return _init_module_from_object(repository, module_obj, filename, parent).prepare()
+
+
+def _init_module_from_file(repository, filename, parent=None):
     module = ModuleInit(repository, filename, parent)
     module.functions = lbuild.node.load_functions_from_file(
         repository,
         filename,
-        required=['init', 'prepare', 'build'],
-        optional=['pre_build', 'validate', 'post_build'],
+        required=REQUIRED_FUNCTIONS,
+        optional=OPTIONAL_FUNCTIONS,
         local={'PreBuildException': le.LbuildValidateException})
 
     module.init()
-    return module.prepare()
+    return module
 
 
-def load_module_from_object(repository, module_obj, filename, parent=None):
+def _init_module_from_object(repository, module_obj, filename, parent=None):
     module = ModuleInit(repository, filename, parent)
     try:
         module.functions = lbuild.utils.get_global_functions(
             module_obj,
-            required=['init', 'prepare', 'build'],
-            optional=['pre_build', 'validate', 'post_build'])
+            required=REQUIRED_FUNCTIONS,
+            optional=OPTIONAL_FUNCTIONS)
 
     except le.LbuildUtilsFunctionNotFoundException as error:
         raise le.LbuildNodeMissingFunctionException(repository, filename, error, module_obj)
 
     module.init()
-    return module.prepare()
+    return module
 
 
 def build_modules(initmodules):
-    rmodules = {}
+    # Index of all module names: either the module node or `NOT_AVAILABLE`
+    index = {}
     modules = []
-    not_available = set()
-    # First convert the modules into node objects
+
+    def connect(module, raise_on_fail=True):
+        parent_name = module.fullname.rsplit(":", 1)[0]
+        parent = index.get(parent_name) if ":" in parent_name else module._repository
+        if parent is NOT_AVAILABLE:
+            # The parent module exists, but it is disabled and thus all its
+            # children modules are disabled as well.
+            module._available = False;
+        elif parent is not None:
+            parent.add_child(module)
+        elif raise_on_fail:
+            raise le.LbuildModuleParentNotFoundException(module, parent_name)
+        else:
+            return False
+        return True
+
+    # Convert the modules into node objects and connect them to their parent
+    # in the same pass. Parent modules are usually loaded before their
+    # submodules, so only the remaining ones are connected afterwards.
+    unconnected = []
     for initmodule in initmodules:
         if initmodule.available:
             module = Module(initmodule)
-            rmodules[module.fullname] = module
+            index[module.fullname] = module
             modules.append(module)
+            if not connect(module, raise_on_fail=False):
+                unconnected.append(module)
         else:
-            not_available.add(initmodule.fullname)
+            index.setdefault(initmodule.fullname, NOT_AVAILABLE)
 
-    # then connect the entire tree
-    for module in modules:
-        parent_name = ":".join(module.fullname.split(":")[:-1])
-        parent = rmodules.get(parent_name) if ":" in parent_name else module._repository
-        if parent:
-            parent.add_child(module)
-        elif parent_name in not_available:
-            # The parent module exists, but it is disabled and thus all its
-            # children modules are disabled as well.
-            module._available = False;
-            not_available.add(module.fullname)
-        else:
-            raise le.LbuildModuleParentNotFoundException(module, parent_name)
+    for module in unconnected:
+        connect(module)
 
     # Now update the tree
     if modules:
@@ -90,9 +115,15 @@ def build_modules(initmodules):
 
 
 class ModuleInit:
+    # One object is created per loaded module, so avoid the instance dict
+    __slots__ = ("filename", "filepath", "repository", "name", "parent",
+                 "context_parent", "description", "functions", "available",
+                 "order", "_format_description", "_format_short_description",
+                 "_submodules", "_options", "_dependencies", "_filters",
+                 "_queries", "_collectors", "_alias")
 
     def __init__(self, repository, filename, parent=None):
-        self.filename = os.path.realpath(filename)
+        self.filename = lbuild.utils.cached_realpath(filename)
         self.filepath = os.path.dirname(self.filename) if filename else None
         self.repository = repository
 
@@ -117,22 +148,22 @@ class ModuleInit:
     @property
     def fullname(self):
         if self.parent is None:
-            return "{}:{}".format(self.repository.name, self.name)
-        return "{}:{}".format(self.parent, self.name)
+            return self.repository.name + ":" + self.name
+        return self.parent + ":" + self.name
 
     def _clean(self, name):
         if name is None or not name: return ("", "");
-        if name.startswith("{}:".format(self.repository.name)):
+        if name.startswith(self.repository.name + ":"):
             name = name[len(self.repository.name):]
         if not name.startswith(":"):
-            name = ":{}".format(name)
-        return name.rsplit(":", 1)
+            name = ":" + name
+        parent, name = name.rsplit(":", 1)
+        return (parent.strip(":"), name)
 
     def init(self):
         # Execute init() function from module to get module name
         lbuild.utils.with_forward_exception(
-            self,
-            lambda: self.functions['init'](lf.ModuleInitFacade(self)))
+            self, self.functions['init'], lf.ModuleInitFacade(self))
 
         if self.name is None:
             raise le.LbuildModuleNoNameException(self)
@@ -143,33 +174,55 @@ class ModuleInit:
         parent_parent, parent_name = self._clean(self.parent)
         name_parent, self.name = self._clean(self.name)
 
-        self.parent = ":".join(p.strip(":") for p in (self.repository.name,
+        self.parent = ":".join(p for p in (self.repository.name,
                                 parent_parent, parent_name, name_parent) if p)
+        # The names are shared by many nodes and used as dictionary keys
+        self.name = sys.intern(self.name)
+        self.parent = sys.intern(self.parent)
 
         self.order = int(self.order)
 
     def prepare(self):
+        all_modules = []
+        # Walk the submodule tree iteratively in depth-first order, instead of
+        # recursively concatenating the module lists of every subtree.
+        pending = [(None, self)]
+        while pending:
+            parent, module = pending.pop()
+            if parent is not None:
+                module = parent._init_submodule(module)
+                # The submodules of a disabled module are disabled as well,
+                # so there is no need to prepare them and their submodules.
+                # Submodules may name a different parent though, so the name
+                # is only known after initialization. Modules that only the
+                # skipped prepare() would add are never loaded, even if they
+                # name a different parent themselves.
+                if not parent.available and module.parent == parent.fullname:
+                    module.available = False
+                    all_modules.append(module)
+                    continue
+            module._prepare()
+            all_modules.append(module)
+            pending.extend((module, submodule) for submodule in reversed(module._submodules))
+        return all_modules
+
+    def _prepare(self):
         self.available = lbuild.utils.with_forward_exception(
-            self,
-            lambda: self.functions["prepare"](lf.ModulePrepareFacade(self),
-                                              self.repository.option_value_resolver))
+            self, self.functions["prepare"], lf.ModulePrepareFacade(self),
+            self.repository.option_value_resolver)
 
-        all_modules = [self]
         if self.available is None:
             raise le.LbuildModuleNoReturnAvailableException(self)
 
-        for submodule in self._submodules:
-            if isinstance(submodule, str):
-                modules = load_module_from_file(repository=self.repository,
-                                                filename=os.path.join(self.filepath, submodule),
-                                                parent=self.fullname)
-            else:
-                modules = load_module_from_object(repository=self.repository,
-                                                  module_obj=submodule,
-                                                  filename=self.filename,
-                                                  parent=self.fullname)
-            all_modules.extend(modules)
-        return all_modules
+    def _init_submodule(self, submodule):
+        if isinstance(submodule, str):
+            return _init_module_from_file(repository=self.repository,
+                                          filename=os.path.join(self.filepath, submodule),
+                                          parent=self.fullname)
+        return _init_module_from_object(repository=self.repository,
+                                        module_obj=submodule,
+                                        filename=self.filename,
+                                        parent=self.fullname)
 
 
 class Module(BaseNode):
@@ -189,16 +242,24 @@ class Module(BaseNode):
         self._filename = module.filename
         self._functions = module.functions
         self._description = module.description
-        self._fullname = module.fullname
+        self.fullname = sys.intern(module.fullname)
         self._available = module.available
         self._build_order = module.order
+        # Resolve the build step functions once instead of on every call
+        self._validate_fn = self._functions.get("validate", self._functions.get("pre_build", None))
+        self._build_fn = self._functions.get("build", None)
+        self._post_build_fn = self._functions.get("post_build", None)
+        # The post-build step may optionally accept the buildlog, which only
+        # needs to be introspected once
+        self._post_build_arity = 0 if self._post_build_fn is None else \
+                len(inspect.signature(self._post_build_fn).parameters)
 
         # Prefix the global filters with the `repo.` name
+        prefix = self._repository._filter_prefix
         for (name, func) in module._filters:
-            if not name.startswith("{}.".format(self._repository.name)):
-                nname = "{}.{}".format(self._repository.name, name)
-                LOGGER.warning("Namespacing module filter '{}' to '{}'!"
-                               .format(name, nname))
+            if not name.startswith(prefix):
+                nname = prefix + name
+                LOGGER.warning("Namespacing module filter '%s' to '%s'!", name, nname)
                 name = nname
             self._filters[name] = func
 
@@ -210,36 +271,35 @@ class Module(BaseNode):
         except le.LbuildNodeDuplicateChildException as error:
             raise le.LbuildModuleDuplicateChildException(self, error)
 
+        # Do not modify the dependencies of the ModuleInit object
         dependencies = module._dependencies
         if ":" in module.parent:
-            dependencies.append(module.parent)
+            dependencies = dependencies + [module.parent]
         self.add_dependencies(*dependencies)
 
     def validate(self, env):
-        validate = self._functions.get("validate", self._functions.get("pre_build", None))
-        if validate is not None:
-            LOGGER.info("Validate {}".format(self.fullname))
-            lbuild.utils.with_forward_exception(self, lambda: validate(env.facade))
+        if self._validate_fn is not None:
+            LOGGER.info("Validate %s", self.fullname)
+            lbuild.utils.with_forward_exception(self, self._validate_fn, env.facade)
 
     def build(self, env):
         LOGGER.info("Build %s", self.fullname)
-        lbuild.utils.with_forward_exception(self, lambda: self._functions["build"](env.facade))
+        lbuild.utils.with_forward_exception(self, self._build_fn, env.facade)
 
     def post_build(self, env):
-        post_build = self._functions.get("post_build", None)
-        if post_build is not None:
-            LOGGER.info("Post-Build {}".format(self.fullname))
-            if len(inspect.signature(post_build).parameters.keys()) == 1:
-                func = lambda: post_build(env.facade)
+        if self._post_build_fn is not None:
+            LOGGER.info("Post-Build %s", self.fullname)
+            if self._post_build_arity == 1:
+                args = (env.facade,)
             else:
-                func = lambda: post_build(env.facade, env.facade_buildlog)
-            lbuild.utils.with_forward_exception(self, func)
+                args = (env.facade, env.facade_buildlog)
+            lbuild.utils.with_forward_exception(self, self._post_build_fn, *args)
 
     def __lt__(self, other):
-        return self.fullname.__lt__(other.fullname)
+        return self.fullname < other.fullname
 
     def __repr__(self):
-        return "Module({})".format(self.fullname)
+        return "Module(" + self.fullname + ")"
 
     def __str__(self):
         return self.fullname
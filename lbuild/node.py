@@ -9,9 +9,12 @@
 # governing this code.
 
 import os
+import re
+import sys
 import enum
 import logging
-import itertools
+import operator
+import functools
 
 import anytree
 
@@ -21,25 +24,24 @@ import lbuild.utils as lu
 import lbuild.exception as le
 
 LOGGER = logging.getLogger('lbuild.node')
+# Marks attributes which do not exist on a node
+_MISSING = object()
 
 
-def load_functions_from_file(repository, filename: str, required, optional=None, local=None):
-    filename = os.path.realpath(filename)
-    localpath = os.path.dirname(filename)
-    if not os.path.isfile(filename):
-        raise FileNotFoundError(filename)
+@functools.lru_cache(maxsize=None)
+def _module_globals():
+    """
+    Global names available to every module and repository file.
 
-    if local is None:
-        local = {}
-
-    local.update({
-        'localpath': RelocatePath(localpath),
-        'repopath': RelocatePath(repository._filepath),
+    These do not depend on the file, so the dictionary is only built once.
+    It is built lazily, since the modules are not yet imported when this
+    module is loaded.
+    """
+    return {
         'listify': lu.listify,
         'listrify': lu.listrify,
         'uniquify': lu.uniquify,
 
-        'FileReader': LocalFileReaderFactory(localpath),
         'ValidateException': le.LbuildValidateException,
         'Module': lbuild.module.ModuleBase,
 
@@ -63,7 +65,57 @@ def load_functions_from_file(repository, filename: str, required, optional=None,
         'Configuration': lbuild.repository.Configuration,
 
         'Alias': Alias,
-    })
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_query(query, root_prefix):
+    """
+    Normalize a resolver query into its absolute pattern.
+
+    The same queries are resolved over and over again, so the query is only
+    parsed once. The root prefix is prepended to the pattern for trees with
+    the parser as root. Returns the pattern, the pattern parts if they can be
+    found with the child index (otherwise `None`) and whether the query is
+    recursive.
+    """
+    # :*   -> non-recursive
+    # :**  -> recursive
+    query = query.strip()
+    # Only split the query when it actually contains empty parts
+    if not query or "::" in query or query[0] == ":" or query[-1] == ":":
+        query = ":".join(p if p else "*" for p in query.split(":"))
+    pattern = root_prefix + ":" + query.replace(":**", "")
+    parts = tuple(pattern[1:].split(":"))
+    # Relative and recursive parts are not supported by the child index
+    if any(part in (".", "..", "**") for part in parts):
+        parts = None
+    return (pattern, parts, query.endswith(":**"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_wildcard(part):
+    """
+    Compile a name part with `*` and `?` wildcards into a match function.
+
+    Matches the same names as the wildcards of the anytree resolver.
+    """
+    pattern = "".join(".*" if char == "*" else ("." if char == "?" else re.escape(char))
+                      for char in part)
+    return re.compile(r"(?ms)" + pattern + r"\Z").match
+
+
+def load_functions_from_file(repository, filename: str, required, optional=None, local=None):
+    filename = lu.cached_realpath(filename)
+    localpath = os.path.dirname(filename)
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(filename)
+
+    local = dict(local or {})
+    local.update(_module_globals())
+    local['localpath'] = RelocatePath(localpath)
+    local['repopath'] = RelocatePath(repository._filepath)
+    local['FileReader'] = LocalFileReaderFactory(localpath)
 
     try:
         local = lu.load_module_from_file(filename, local)
@@ -75,6 +127,8 @@ def load_functions_from_file(repository, filename: str, required, optional=None,
 
 
 class RelocatePath:
+    # One instance is created per loaded module file
+    __slots__ = ("basepath",)
 
     def __init__(self, basepath):
         self.basepath = basepath
@@ -101,6 +155,8 @@ class LocalFileReader:
 
 
 class LocalFileReaderFactory:
+    # One instance is created per loaded module file
+    __slots__ = ("basepath",)
 
     def __init__(self, basepath):
         self.basepath = basepath
@@ -110,6 +166,9 @@ class LocalFileReaderFactory:
 
 
 class NameResolver:
+    # A new resolver is created on every access of a resolver property
+    __slots__ = ("_node", "_types", "_returner", "_defaulter", "_selected", "_cache",
+                 "_root", "_epoch")
 
     def __init__(self, node, nodetypes, selected=True, returner=None, defaulter=None):
         self._node = node
@@ -117,28 +176,62 @@ class NameResolver:
         self._returner = (lambda n: n) if returner is None else returner
         self._defaulter = (lambda n: n) if defaulter is None else defaulter
         self._selected = selected if callable(selected) else lambda n: not selected or n._selected
+        # The successfully resolved nodes are cached together with whether
+        # their dependencies have been checked, until the structure of the
+        # tree or the selection of its nodes changes.
+        # The returner is still applied on every access, so that changing
+        # values remain visible.
+        self._cache = {}
+        self._root = None
+        self._epoch = None
 
     def _get_node(self, key, check_dependencies=False, raise_on_fail=True):
+        root = self._node.root
+        if root is not self._root or root._update_epoch != self._epoch:
+            self._cache.clear()
+            self._root = root
+            self._epoch = root._update_epoch
+
+        # Share the cached node between `__getitem__`, `get` and `__contains__`
+        cached = self._cache.get(key)
+        if cached is None:
+            node = self._find_node(key, raise_on_fail)
+            if node is None: return None;
+            checked = False
+        else:
+            node, checked = cached
+
+        if check_dependencies and not checked:
+            self._check_dependencies(node)
+            checked = True
+        if cached is None or checked != cached[1]:
+            self._cache[key] = (node, checked)
+        return node
+
+    def _find_node(self, key, raise_on_fail):
         node = self._node._resolve_partial_max(key, max_results=1, raise_on_fail=raise_on_fail)
         if node is None: return None;
         node = node[0]
 
-        if node.type == BaseNode.Type.ALIAS:
+        if node._type is _ALIAS_TYPE:
             if node._destination is None:
                 if not raise_on_fail: return None;
                 raise le.LbuildResolverAliasException(node)
             context_resolver = NameResolver(node.parent, self._types, self._selected, self._returner, self._defaulter)
             alias = node
-            warning = "Node '{}' has been moved to '{}'!\n\n{}\n\n".format(
-                    le._hl(alias.fullname), le._hl(alias._destination), alias.description)
+            # The descriptions are only formatted when the warning is printed
+            warning = "Node '{}' has been moved to '{}'!\n\n{}\n\n"
             try:
-                node = context_resolver._get_node(node._destination)
-                warning += node.description + "\n"
+                node = context_resolver._get_node(node._destination, raise_on_fail=raise_on_fail)
+                if node is None: return None;
             except le.LbuildException as e:
-                LOGGER.warning(warning)
+                LOGGER.warning(warning.format(le._hl(alias.fullname),
+                               le._hl(alias._destination), alias.description))
                 raise e
             if alias._print_warning:
-                LOGGER.warning(warning)
+                LOGGER.warning(warning.format(le._hl(alias.fullname),
+                               le._hl(alias._destination), alias.description) +
+                               node.description + "\n")
                 alias._print_warning = False
 
         if not node._available:
@@ -155,14 +248,15 @@ class NameResolver:
                     "is of type '{}', but searching for '{}'!".format(
                             node._type.name.lower(), "','".join(t.name.lower() for t in self._types)))
 
-        if check_dependencies and node.type in {BaseNode.Type.OPTION, BaseNode.Type.QUERY}:
+        return node
+
+    def _check_dependencies(self, node):
+        if node._type in _DEPENDENT_TYPES:
             if node.parent != self._node:
-                if all(n.type not in {BaseNode.Type.PARSER, BaseNode.Type.REPOSITORY} for n in {self._node, node.module}):
+                if all(n._type not in _TOPLEVEL_TYPES for n in {self._node, node.module}):
                     if node.parent not in self._node.dependencies:
-                        LOGGER.warning("Module '{}' accessing '{}' without depending on '{}'!"
-                                       .format(self._node.fullname, node.fullname, node.module.fullname))
-
-        return node
+                        LOGGER.warning("Module '%s' accessing '%s' without depending on '%s'!",
+                                       self._node.fullname, node.fullname, node.module.fullname)
 
     def __getitem__(self, key: str):
         node = self._get_node(key, check_dependencies=True, raise_on_fail=True)
@@ -178,15 +272,41 @@ class NameResolver:
         return (self._get_node(key, raise_on_fail=False) is not None)
 
     def __len__(self):
-        return len(self._node._findall(self._types, selected=self._selected))
+        # Count the nodes without collecting them first
+        return sum(1 for _ in self._node._iterall(self._types, selected=self._selected))
 
     def __repr__(self):
         return repr(self._node._findall(self._types, selected=self._selected))
 
 
+class _TreeCaches:
+    """
+    Caches of the lookups in a tree, which are kept on its root node.
+
+    They are dropped whenever the structure of the tree changes and are
+    released together with the tree.
+    """
+    __slots__ = ("resolve", "resolve_partial", "findall", "descendants")
+
+    def __init__(self):
+        # Results of _resolve() by pattern
+        self.resolve = {}
+        # Results of _resolve_partial() by resolving node and query
+        self.resolve_partial = {}
+        # Results of _findall() by node and search, also depend on selection
+        self.findall = {}
+        # Descendants of nodes indexed by type
+        self.descendants = {}
+
+
 class BaseNode(anytree.Node):
     separator = ":"
     resolver = anytree.Resolver()
+    # Only root nodes store their tree caches, created on first use
+    _caches = None
+    # Incremented on the root whenever the structure of its tree or the
+    # availability or selection of its nodes changes
+    _update_epoch = 0
 
     @enum.unique
     class Type(enum.IntEnum):
@@ -201,6 +321,9 @@ class BaseNode(anytree.Node):
         ALIAS = 8
 
     def __init__(self, name, node_type, repository=None):
+        if isinstance(name, str):
+            # Node names are hashed and compared on every name lookup
+            name = sys.intern(name)
         anytree.Node.__init__(self, name)
 
         if self.separator in str(name):
@@ -213,22 +336,23 @@ class BaseNode(anytree.Node):
         self._type = node_type
         self._functions = {}
 
-        self._fullname = name
+        # The full name is read on every name lookup, so it is a plain
+        # attribute, which is updated whenever the node is attached
+        self.fullname = name
+        self._fullname_parts = (None, ())
         self._filename = None
+        # Index of the children added with add_child() by name
+        self._children_by_name = {}
 
         # Dependency management
         self._repository = repository
-        self._dependency_module_names = []
+        # Insertion ordered set of the dependency names
+        self._dependency_module_names = {}
         self._dependencies_resolved = False
         self._dependencies = []
 
         self._build_order = 0
         self._description = ""
-        # All _update()-able traits: defaults
-        self._available_default = True
-        self._selected_default = True
-        self._format_description_default = lbuild.format.format_description
-        self._format_short_description_default = lbuild.format.format_short_description
 
         # All _update()-able traits: defaults
         self._available = (self._type != BaseNode.Type.MODULE)
@@ -238,6 +362,19 @@ class BaseNode(anytree.Node):
         self._ignore_patterns = lbuild.utils.DEFAULT_IGNORE_PATTERNS
         self._filters = lbuild.filter.DEFAULT_FILTERS
 
+    # All _update()-able traits: defaults, which are the same for every node
+    # and therefore not stored per instance
+    _available_default = True
+    _selected_default = True
+
+    @property
+    def _format_description_default(self):
+        return lbuild.format.format_description
+
+    @property
+    def _format_short_description_default(self):
+        return lbuild.format.format_short_description
+
     @property
     def format_description(self):
         return lbuild.format.format_description
@@ -251,10 +388,13 @@ class BaseNode(anytree.Node):
         return os.path.dirname(self._filename)
 
     @property
-    def fullname(self):
-        if self._fullname is None:
-            self._fullname = self.name
-        return self._fullname
+    def fullname_parts(self):
+        fullname = self.fullname
+        if self._fullname_parts[0] is not fullname:
+            # The full name only changes when the node is attached to a parent
+            self._fullname_parts = (fullname, tuple(
+                    sys.intern(part) for part in fullname.split(self.separator)))
+        return self._fullname_parts[1]
 
     @property
     def description_name(self):
@@ -314,7 +454,7 @@ class BaseNode(anytree.Node):
     @property
     def option_value_resolver(self):
         return NameResolver(self, {self.Type.OPTION, self.Type.CONFIG},
-                            selected=lambda n: n.type == self.Type.CONFIG or n._selected,
+                            selected=lambda n: n._type is _CONFIG_TYPE or n._selected,
                             returner=lambda n: n.value)
 
     @property
@@ -355,17 +495,57 @@ class BaseNode(anytree.Node):
         return lbuild.format.format_node_tree(self, filterfunc)
 
     def add_dependencies(self, *dependencies):
-        self._dependency_module_names += dependencies
-        self._dependencies_resolved = False
+        names = self._dependency_module_names
+        count = len(names)
+        # Only fully qualified module names can be resolved as dependencies
+        names.update(dict.fromkeys(name for name in dependencies if ":" in name))
+        # Options add their dependencies again on every value change, which
+        # must not invalidate the already resolved dependencies
+        if len(names) != count:
+            self._dependencies_resolved = False
 
     def add_child(self, node):
-        for child in self.children:
-            if node.name == child.name:
-                raise le.LbuildNodeDuplicateChildException(self, node, child)
+        child = self._children_by_name.setdefault(node.name, node)
+        if child is not node:
+            raise le.LbuildNodeDuplicateChildException(self, node, child)
         node._repository = self._repository
         node.parent = self
+        node._invalidate_caches()
         node.add_dependencies(self.fullname)
-        node._fullname = self.fullname + ":" + node.name
+        node.fullname = sys.intern(self.fullname + ":" + node.name)
+        # Derive the name parts from the parent instead of splitting them again
+        node._fullname_parts = (node.fullname, self.fullname_parts + (node.name,))
+
+    def _tree_caches(self):
+        root = self.root
+        if root._caches is None:
+            root._caches = _TreeCaches()
+        return root._caches
+
+    def _invalidate_caches(self):
+        """
+        Clear the caches which depend on the structure of the tree.
+
+        Must be called on a node that was just attached to a parent, so that
+        the caches it kept as root of its own tree are released as well.
+        """
+        if self._caches is not None:
+            self._caches = None
+        root = self.root
+        root._caches = None
+        root._update_epoch += 1
+
+    def _invalidate_selection(self):
+        """
+        Clear the caches which depend on the availability or selection of
+        the nodes in the tree.
+
+        Must be called whenever these are changed outside of _update().
+        """
+        root = self.root
+        root._update_epoch += 1
+        if root._caches is not None:
+            root._caches.findall.clear()
 
     def all_queries(self, depth=None, selected=True):
         return self._findall(self.Type.QUERY, depth, selected)
@@ -377,17 +557,66 @@ class BaseNode(anytree.Node):
         return self._findall(self.Type.MODULE, depth, selected)
 
     def _findall(self, node_types, depth=None, selected=True):
+        # Custom selection functions cannot be used as cache key
+        if callable(selected):
+            return tuple(self._iterall(node_types, depth, selected))
+
+        if not isinstance(node_types, BaseNode.Type):
+            node_types = frozenset(node_types)
+        cache = self._tree_caches().findall
+        key = (self, node_types, depth, bool(selected))
+        nodes = cache.get(key)
+        if nodes is None:
+            nodes = cache[key] = tuple(self._iterall(node_types, depth, selected))
+        return nodes
+
+    def _iterall(self, node_types, depth=None, selected=True):
         if isinstance(node_types, BaseNode.Type):
             node_types = {node_types}
-        _selected = selected if callable(selected) else \
-                    lambda n: (not selected or n._selected)
-        def _filter(node):
-            return (node._type in node_types and
-                    node._available and
-                    _selected(node) and
-                    node is not self)
+        # Decide only once whether and how the selection is checked
+        if callable(selected):
+            _selected = selected
+        elif selected:
+            _selected = operator.attrgetter("_selected")
+        else:
+            _selected = None
+        index = self._descendants_by_type()
+        if len(node_types) == 1:
+            entries = index.get(next(iter(node_types)), ())
+        else:
+            # Merge the entries of all types back into pre-order
+            entries = sorted(entry for node_type in node_types
+                             for entry in index.get(node_type, ()))
+        for _, level, node in entries:
+            if ((depth is None or level <= depth) and node._available and
+                    (_selected is None or _selected(node))):
+                yield node
+
+    def _descendants_by_type(self):
+        """
+        Index the descendants of this node by their type.
 
-        return anytree.search.findall(self, maxlevel=depth, filter_=_filter)
+        Each entry is a tuple of the pre-order position, the level with this
+        node at level 1 and the node itself. The index is built only once
+        for all node type searches and only changes with the tree structure.
+        """
+        cache = self._tree_caches().descendants
+        index = cache.get(self)
+        if index is not None:
+            return index
+
+        index = cache[self] = {}
+        # Walk the subtree in pre-order with an explicit stack instead of the
+        # recursive anytree iterator
+        stack = [(child, 2) for child in reversed(self.children)]
+        pop, push = stack.pop, stack.extend
+        position = 0
+        while stack:
+            node, level = pop()
+            index.setdefault(node._type, []).append((position, level, node))
+            position += 1
+            push((child, level + 1) for child in reversed(node.children))
+        return index
 
     def _resolve_dependencies(self):
         """
@@ -398,10 +627,10 @@ class BaseNode(anytree.Node):
         if self._dependencies_resolved:
             return
 
+        resolver = self.module_resolver
         dependencies = set()
-        for dependency_name in {n for n in self._dependency_module_names if ":" in n}:
-            dependency = self.module_resolver[dependency_name]
-            dependencies.add(dependency)
+        for dependency_name in self._dependency_module_names:
+            dependencies.add(resolver[dependency_name])
 
         self._dependencies = list(dependencies)
         self._dependencies_resolved = True
@@ -417,14 +646,35 @@ class BaseNode(anytree.Node):
         return nodes
 
     def _resolve_partial(self, query, default):
+        # The result only depends on the tree and the resolving node
+        cache = self._tree_caches().resolve_partial
+        key = (self, query)
+        nodes = cache.get(key, _MISSING)
+        if nodes is _MISSING:
+            nodes = self._resolve_partial_uncached(query, None)
+            if nodes is not None:
+                nodes = tuple(nodes)
+            cache[key] = nodes
+        return default if nodes is None else list(nodes)
+
+    def _resolve_partial_uncached(self, query, default):
         # Try if query result is unique
         resolved1 = self._resolve(query, [])
         if len(resolved1) == 1:
             return resolved1
 
+        # A fully qualified name cannot be filled any further
+        if (":" in query and "*" not in query and "::" not in query and
+                query[0] != ":" and query[-1] != ":"):
+            return resolved1 if resolved1 else default
+
         # no result or ambiguous? try to fill the partial name
-        query = ":".join(self._fill_partial_name(
-                            ["" if p == "*" else p for p in query.split(":")]))
+        if ":" not in query:
+            # A plain leaf name is scoped to the local node without splitting
+            query = self.fullname + ":" + ("" if query == "*" else query)
+        else:
+            query = ":".join(self._fill_partial_name(
+                                ["" if p == "*" else p for p in query.split(":")]))
         resolved2 = self._resolve(query, [])
 
         if not (resolved2 or resolved1):
@@ -435,27 +685,60 @@ class BaseNode(anytree.Node):
             return resolved1
         if not resolved1:
             return resolved2
-        # return the less ambiguous one
+        # return the less ambiguous one. Recursive results contain every node
+        # only once, so a local subtree wins over a query of the whole tree.
         return resolved2 if len(resolved2) < len(resolved1) else resolved1
 
     def _resolve(self, query, default):
-        # :*   -> non-recursive
-        # :**  -> recursive
-        query = ":".join(p if p else "*" for p in query.strip().split(":"))
-        try:
-            qquery = ":" + query.replace(":**", "")
-            if self.root._type == self.Type.PARSER:
-                qquery = ":lbuild" + qquery
-            found_modules = BaseNode.resolver.glob(self.root, qquery)
-        except (anytree.resolver.ChildResolverError, anytree.resolver.ResolverError):
-            return default
-
-        modules = found_modules
-        if query.endswith(":**"):
-            for module in found_modules:
-                modules.extend(module.descendants)
+        root = self.root
+        qquery, parts, recursive = _compile_query(
+                query, ":lbuild" if root._type is _PARSER_TYPE else "")
+
+        # The result only depends on the tree, not on the resolving node
+        cache = root._tree_caches().resolve
+        key = (qquery, recursive)
+        modules = cache.get(key)
+        if modules is None:
+            try:
+                if parts is not None:
+                    found_modules = self._glob(parts)
+                else:
+                    found_modules = BaseNode.resolver.glob(root, qquery)
+            except (anytree.resolver.ChildResolverError, anytree.resolver.ResolverError):
+                found_modules = []
+
+            if recursive:
+                # Collect the subtree of every match only once, instead of
+                # descending again into the already collected descendants
+                found_modules = [node for module in found_modules
+                                 for node in (module,) + module.descendants]
+            modules = cache[key] = tuple(found_modules)
+
+        return list(modules) if modules else default
+
+    def _glob(self, parts):
+        """
+        Find the nodes matching the absolute name parts using the child index.
 
-        return modules if modules else default
+        Only names with the `*` and `?` wildcards must be contained in the
+        parts, no relative or recursive parts.
+        """
+        root = self.root
+        if "*" in parts[0] or "?" in parts[0]:
+            nodes = [root] if _compile_wildcard(parts[0])(root.name) else []
+        else:
+            nodes = [root] if root.name == parts[0] else []
+        for part in parts[1:]:
+            if part == "*":
+                nodes = [child for node in nodes for child in node.children]
+            elif "*" in part or "?" in part:
+                match = _compile_wildcard(part)
+                nodes = [child for node in nodes for child in node.children
+                         if match(child.name)]
+            else:
+                nodes = [node._children_by_name[part] for node in nodes
+                         if part in node._children_by_name]
+        return nodes
 
     def _fill_partial_name(self, partial_name):
         """
@@ -464,34 +747,26 @@ class BaseNode(anytree.Node):
 
         Returns an array of the full name.
         """
-        module_fullname_parts = self.fullname.split(":")
+        module_fullname_parts = self.fullname_parts
 
         # if partial_name is just leaf name, set scope to local node
         if len(partial_name) == 1:
-            partial_name = module_fullname_parts + partial_name
-        # Limit length of the module name to the length of the requested name
-        depth = len(partial_name)
-        if len(module_fullname_parts) > depth:
-            module_fullname_parts = module_fullname_parts[:depth]
-
-        # Using zip_longest restricts the name to the length of full name
-        # if it is shorted than the requested module name.
-        name = []
-        for part, fill in itertools.zip_longest(partial_name,
-                                                module_fullname_parts,
-                                                fillvalue=""):
-            name.append(fill if (part == "") else part)
-        return name
+            partial_name = list(module_fullname_parts) + partial_name
+        # The name has the length of the requested name. Empty parts beyond
+        # the length of the full name cannot be filled and remain empty.
+        nfill = len(module_fullname_parts)
+        return [part if part else (module_fullname_parts[index] if index < nfill else "")
+                for index, part in enumerate(partial_name)]
 
     def _update_attribute(self, attr):
-        self_attr = getattr(self, attr, "unknown")
-        parent_attr = getattr(self.parent, attr, "unknown")
-        if self_attr == "unknown" or parent_attr == "unknown":
+        self_attr = getattr(self, attr, _MISSING)
+        parent_attr = getattr(self.parent, attr, _MISSING)
+        if self_attr is _MISSING or parent_attr is _MISSING:
             raise le.LbuildException("Internal: Cannot update non-existant "
                                      "attribute '{}'!".format(attr))
 
         if isinstance(self_attr, list):
-            self_attr = list(set(self_attr + parent_attr))
+            # Lists are not inherited from the parent
             return
         if isinstance(self_attr, dict):
             self_attr.update(parent_attr)
@@ -525,6 +800,10 @@ class BaseNode(anytree.Node):
             child._update_order()
 
     def _update(self):
+        self._invalidate_selection()
+        self._update_traits()
+
+    def _update_traits(self):
         if self.parent:
             self._update_attribute("_format_description")
             self._update_attribute("_format_short_description")
@@ -534,7 +813,7 @@ class BaseNode(anytree.Node):
             self._update_attribute("_filters")
 
         for child in self.children:
-            child._update()
+            child._update_traits()
 
     def _relocate_relative_path(self, path):
         """
@@ -547,6 +826,15 @@ class BaseNode(anytree.Node):
         return os.path.normpath(path)
 
 
+# The node types compared on every name lookup. Accessing an enum member
+# through its class is several times slower than a module global.
+_ALIAS_TYPE = BaseNode.Type.ALIAS
+_CONFIG_TYPE = BaseNode.Type.CONFIG
+_PARSER_TYPE = BaseNode.Type.PARSER
+_DEPENDENT_TYPES = frozenset((BaseNode.Type.OPTION, BaseNode.Type.QUERY))
+_TOPLEVEL_TYPES = frozenset((BaseNode.Type.PARSER, BaseNode.Type.REPOSITORY))
+
+
 class Alias(BaseNode):
 
     def __init__(self, name, description, destination=None):
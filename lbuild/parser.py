@@ -10,7 +10,6 @@
 
 import sys
 import enum
-import os.path
 import random
 import logging
 import collections
@@ -22,7 +21,6 @@ import lbuild.exception as le
 
 from .node import BaseNode
 from .config import ConfigNode
-from .facade import BuildLogFacade
 from .buildlog import BuildLog
 
 from . import repository
@@ -89,7 +87,7 @@ class Parser(BaseNode):
         return {o.fullname:o for o in self.all_options() if o.depth > 2}
 
     def load_repositories(self, repofilenames=None):
-        repofiles = set(os.path.realpath(p) for p in utils.listify(repofilenames))
+        repofiles = set(utils.cached_realpath(p) for p in utils.listify(repofilenames))
         parsed = set()
 
         while True:
@@ -102,7 +100,7 @@ class Parser(BaseNode):
 
             # Parse only new repositories
             for repofile in repofiles:
-                repo = self.parse_repository(repofile)
+                self.parse_repository(repofile)
 
             # nothing more to extend
             if not self._config_flat._extends:
@@ -117,6 +115,7 @@ class Parser(BaseNode):
                     try:
                         fconfig = self.config_resolver[alias]
                         fconfig._selected = True
+                        fconfig._invalidate_selection()
                         if version: fconfig.value = version
                     except le.LbuildResolverNoMatchException:
                         raise le.LbuildConfigAliasNotFoundException(self, alias)
@@ -137,10 +136,11 @@ class Parser(BaseNode):
         structure.
         """
         repo = repository.load_repository_from_file(self, repofilename)
-        conflict = next((c for c in self.children if c.name == repo.name), None)
-        if conflict is not None:
+        conflict = self._children_by_name.setdefault(repo.name, repo)
+        if conflict is not repo:
             raise le.LbuildParserDuplicateRepoException(self, repo, conflict)
         repo.parent = self
+        repo._invalidate_caches()
 
         return repo
 
@@ -207,7 +207,7 @@ class Parser(BaseNode):
         Returns:
             list: Required modules for the given list of modules.
         """
-        selected_modules = set(requested_modules.copy())
+        selected_modules = set(requested_modules)
         LOGGER.info("Selected modules: %s",
                     ", ".join(sorted(module.fullname for module in selected_modules)))
 
@@ -254,15 +254,16 @@ class Parser(BaseNode):
         return [node for q in utils.listify(queries) for node in self.find_any(q)]
 
     def find_any(self, queries, types=None):
-        nodes = set()
-        for query in utils.listify(queries):
+        # Ordered dicts keep the result deterministic and skip repeated queries
+        nodes = {}
+        for query in dict.fromkeys(utils.listify(queries)):
             result = self._resolve_partial(query, None)
             if result is None:
                 raise le.LbuildParserNodeNotFoundException(self, query, types)
-            nodes |= set(result)
+            nodes.update(dict.fromkeys(result))
         if types:
-            types = utils.listify(types)
-            nodes = [n for n in nodes if any(n.type == t for t in types)]
+            types = set(utils.listify(types))
+            return [n for n in nodes if n.type in types]
         return list(nodes)
 
     @staticmethod
@@ -292,13 +293,17 @@ class Parser(BaseNode):
             env = lbuild.environment.Environment(node, buildlog)
             groups[node._build_order][node.depth].append(Runner(node, env))
 
+        # Enforce that the submodules are always build before their parent modules.
+        # The order of the groups is fixed, so it is only sorted once for all steps.
+        ordered_groups = []
+        for order in sorted(groups):
+            group = groups[order]
+            ordered_groups.extend(group[depth] for depth in sorted(group, reverse=True))
+
         def walk_modules():
-            # Enforce that the submodules are always build before their parent modules
-            for group in (groups[index] for index in sorted(groups)):
-                for modules in (group[index] for index in sorted(group, reverse=True)):
-                    random.shuffle(modules)
-                    for module in modules:
-                        yield module
+            for modules in ordered_groups:
+                random.shuffle(modules)
+                yield from modules
 
         # Merge config collectors values
         resolver = self.collector_available_resolver
@@ -8,7 +8,6 @@
 # governing this code.
 
 import inspect
-import textwrap
 
 from .exception import LbuildQueryConstructionException
 from .node import BaseNode
@@ -25,6 +24,7 @@ class Query(BaseNode):
             if "<lambda>" in fname:
                 raise LbuildQueryConstructionException(self, "'{}' must have a name!".format(function))
             self.name = fname
+            self.fullname = fname
 
         descr = inspect.getdoc(function)
         if descr is not None:
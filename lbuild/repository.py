@@ -52,7 +52,7 @@ def load_repository_from_file(parser, filename):
 
 class RepositoryInit:
     def __init__(self, parser, filename):
-        self._filename = os.path.realpath(filename)
+        self._filename = lbuild.utils.cached_realpath(filename)
         self._filepath = os.path.dirname(self._filename) if filename else None
         self._functions = {}
         self._parser = parser
@@ -102,11 +102,12 @@ class Repository(BaseNode):
 
         self._ignore_patterns.extend(repo._ignore_patterns)
         # Prefix the global filters with the `repo.` name
+        # This prefix is shared with all modules of this repository
+        self._filter_prefix = self.name + "."
         for (name, func) in repo._filters:
-            if not name.startswith("{}.".format(self.name)):
-                nname = "{}.{}".format(self.name, name)
-                LOGGER.warning("Namespacing repository filter '{}' to '{}'!"
-                               .format(name, nname))
+            if not name.startswith(self._filter_prefix):
+                nname = self._filter_prefix + name
+                LOGGER.warning("Namespacing repository filter '%s' to '%s'!", name, nname)
                 name = nname
             self._filters[name] = func
 
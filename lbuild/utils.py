@@ -14,6 +14,7 @@ import sys
 import uuid
 import shutil
 import fnmatch
+import functools
 import importlib.util
 import importlib.machinery
 
@@ -107,22 +108,20 @@ def get_global_functions(env, required, optional=None):
         required: List of required functions.
         optional: List of optional functions.
     """
+    if isinstance(env, dict):
+        get = env.get
+    else:
+        get = lambda name: getattr(env, name, None)
 
-    def get(name, fail=True):
-        if isinstance(env, dict):
-            val = env.get(name, None)
-        else:
-            val = getattr(env, name, None)
-        if fail and val is None:
+    functions = {}
+    for name in required:
+        function = get(name)
+        if function is None:
             raise le.LbuildUtilsFunctionNotFoundException(name, required, optional)
-        return val
-
-    if optional is None:
-        optional = []
+        functions[name] = function
 
-    functions = {}
-    for name in required + optional:
-        function = get(name, name in required)
+    for name in (optional or ()):
+        function = get(name)
         if function is not None:
             functions[name] = function
 
@@ -162,7 +161,9 @@ def load_module_from_file(filename, local, modulename=None):
 
     try:
         # Load the module. This executes the code inside the lbuild module file.
-        loader.exec_module(module)
+        stat = os.stat(filename)
+        code = _compile_module_file(filename, stat.st_mtime_ns, stat.st_size)
+        exec(code, module.__dict__)
     except Exception as error:
         raise le.LbuildForwardException(modulename, error)
 
@@ -170,12 +171,45 @@ def load_module_from_file(filename, local, modulename=None):
     return module.__dict__
 
 
-def with_forward_exception(module, function):
+@functools.lru_cache(maxsize=512)
+def _compile_module_file(filename, mtime, size):
+    """
+    Compile a module file only once for each file modification.
+
+    The same module files are executed for every parser instance, however,
+    only their namespace must be fresh, the compiled code can be reused.
+    """
+    with open(filename, "rb") as file:
+        source = file.read()
+    return compile(source, filename, "exec", dont_inherit=True)
+
+
+def cached_realpath(path):
+    """
+    Resolve the canonical path only once for each path.
+
+    Module files are loaded repeatedly from the same locations, and
+    resolving them requires a system call for every path component.
+    """
+    # Relative paths depend on the working directory, so only absolute paths
+    # can be cached. Making a path absolute requires no system call.
+    return _cached_realpath(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_realpath(path):
+    return os.path.realpath(path)
+
+
+def with_forward_exception(module, function, *args):
     """
     Run a function a store exceptions as forward exceptions.
+
+    Any additional arguments are passed on to the function, which avoids
+    wrapping the call into a lambda.
     """
     try:
-        return function()
+        return function(*args)
     except le.LbuildException:
         raise
     except Exception as error:
@@ -9,6 +9,7 @@
 # 2-clause BSD license. See the file `LICENSE.txt` for the full license
 # governing this code.
 
+import io
 import os
 import sys
 import unittest
@@ -79,6 +80,14 @@ class BuildLogTest(unittest.TestCase):
 </buildlog>
 """, self.log.to_xml(path="/"))
 
+    def test_should_stream_xml(self):
+        self.log.log(self.module1, "in1", "out1")
+        self.log.log(self.module2, "in2", "out2")
+
+        stream = io.BytesIO()
+        self.log.to_xml_stream(stream, path="/")
+        self.assertEqual(self.log.to_xml(path="/"), stream.getvalue())
+
     def test_should_provide_operations_per_module(self):
         o1a = self.log.log(self.module1a, "in1a", "/out1a")
         o1 = self.log.log(self.module1, "in1", "/out1")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018, Niklas Hauser
+# All Rights Reserved.
+#
+# The file is part of the lbuild project and is released under the
+# 2-clause BSD license. See the file `LICENSE.txt` for the full license
+# governing this code.
+
+import io
+import os
+import sys
+import tempfile
+import contextlib
+import unittest
+
+# Hack to support the usage of `coverage`
+sys.path.append(os.path.abspath("."))
+
+import lbuild
+
+
+class MainTest(unittest.TestCase):
+
+    def setUp(self):
+        self.argument_parser = lbuild.main.prepare_argument_parser()
+
+    def test_should_read_arguments_from_file(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "args.txt")
+            with open(filename, "w") as argfile:
+                argfile.write("-Drepo:target=hosted\n-Drepo:module:option=1\n")
+
+            args = self.argument_parser.parse_args(
+                ["-r", "repo.lb", "@" + filename, "-Drepo:other=2", "discover"])
+
+        self.assertEqual(["repo.lb"], args.repositories)
+        self.assertEqual(["repo:target=hosted", "repo:module:option=1", "repo:other=2"],
+                         args.options)
+
+    def test_should_not_accept_literal_arguments_starting_with_at(self):
+        # Arguments starting with `@` are always read as a file
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                self.argument_parser.parse_args(
+                    ["-Drepo:target=hosted", "@missing-file.txt", "discover"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,95 @@ class ModuleTest(unittest.TestCase):
             moduleinit, = lm.load_module_from_object(self.repo, ModuleDuplicateChild(), __file__)
             lm.Module(moduleinit)
 
+    def test_module_unavailable_skips_submodules(self):
+        class Submodule:
+            def init(self, module):
+                module.name = "submodule"
+            def prepare(self, module, option):
+                raise RuntimeError("Submodule of unavailable module must not be prepared!")
+            def build(self, env):
+                pass
+        class UnavailableModule:
+            def init(self, module):
+                module.name = "repo:module"
+            def prepare(self, module, option):
+                module.add_submodule(Submodule())
+                return False
+            def build(self, env):
+                pass
+        moduleinits = lm.load_module_from_object(self.repo, UnavailableModule(), __file__)
+        self.assertEqual(["repo:module", "repo:module:submodule"],
+                         [m.fullname for m in moduleinits])
+        self.assertFalse(any(m.available for m in moduleinits))
+
+    def test_module_unavailable_prepares_submodules_of_other_parents(self):
+        class Module:
+            def init(self, module):
+                module.name = "repo:other"
+            def prepare(self, module, option):
+                return True
+            def build(self, env):
+                pass
+        class Submodule:
+            def init(self, module):
+                module.name = "repo:other:sub"
+            def prepare(self, module, option):
+                return True
+            def build(self, env):
+                pass
+        class UnavailableModule:
+            def init(self, module):
+                module.name = "repo:unavail"
+            def prepare(self, module, option):
+                module.add_submodule(Submodule())
+                return False
+            def build(self, env):
+                pass
+        moduleinits = lm.load_module_from_object(self.repo, Module(), __file__)
+        moduleinits += lm.load_module_from_object(self.repo, UnavailableModule(), __file__)
+        lm.build_modules(moduleinits)
+        self.assertEqual(["repo:other", "repo:other:sub"],
+                         sorted(m.fullname for m in self.repo.all_modules()))
+
+    def test_module_unavailable_skips_submodules_of_skipped_submodules(self):
+        class Module:
+            def init(self, module):
+                module.name = "repo:other"
+            def prepare(self, module, option):
+                return True
+            def build(self, env):
+                pass
+        class Subsubmodule:
+            def init(self, module):
+                module.name = "repo:other:sub"
+            def prepare(self, module, option):
+                return True
+            def build(self, env):
+                pass
+        class Submodule:
+            def init(self, module):
+                module.name = "submodule"
+            def prepare(self, module, option):
+                # Neither the missing return value nor the submodule is seen
+                module.add_submodule(Subsubmodule())
+            def build(self, env):
+                pass
+        class UnavailableModule:
+            def init(self, module):
+                module.name = "repo:unavail"
+            def prepare(self, module, option):
+                module.add_submodule(Submodule())
+                return False
+            def build(self, env):
+                pass
+        moduleinits = lm.load_module_from_object(self.repo, UnavailableModule(), __file__)
+        self.assertEqual(["repo:unavail", "repo:unavail:submodule"],
+                         [m.fullname for m in moduleinits])
+        moduleinits += lm.load_module_from_object(self.repo, Module(), __file__)
+        lm.build_modules(moduleinits)
+        self.assertEqual(["repo:other"],
+                         [m.fullname for m in self.repo.all_modules()])
+
     def test_module_name_test(self):
 
         def _test_name(valid, name, parent=None):
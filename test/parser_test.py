@@ -149,6 +149,19 @@ class ParserTest(unittest.TestCase):
         self.assertIn("repo2:module4:submodule1", self.parser.modules)
         self.assertIn("repo2:module4:submodule2", self.parser.modules)
 
+    def test_should_resolve_recursive_query_in_local_repository(self):
+        repo1 = self.parser.parse_repository(self._get_path("combined/repo1.lb"))
+        self.parser.parse_repository(self._get_path("combined/repo2/repo2.lb"))
+        self.parser.merge_repository_options()
+        self.parser.prepare_repositories()
+
+        # Every node is contained only once in a recursive result, so the
+        # subtree of the repository is less ambiguous than the whole tree
+        nodes = repo1._resolve_partial("**", None)
+        self.assertEqual(len(nodes), len(set(nodes)))
+        self.assertEqual([repo1] + list(repo1.descendants), nodes)
+        self.assertEqual(nodes, repo1._resolve_partial("repo1:**", None))
+
     def test_should_merge_options(self):
         self.parser.parse_repository(self._get_path("combined/repo1.lb"))
         self.parser.parse_repository(self._get_path("combined/repo2/repo2.lb"))
@@ -17,6 +17,7 @@ import unittest
 sys.path.append(os.path.abspath("."))
 
 import io, contextlib
+import gc, weakref
 import lbuild, logging
 from lbuild.option import *
 from lbuild.node import Alias
@@ -96,6 +97,67 @@ class ResolverTest(unittest.TestCase):
         self.assertEqual(True, resolver[":other:xyz"])
         self.assertEqual("Hello World!", resolver["::abc"])
 
+    def test_resolver_should_return_current_value(self):
+        resolver = self.module.option_value_resolver
+        self.assertEqual(456, resolver["foo"])
+        self.module.option_resolver["foo"].value = 123
+        self.assertEqual(123, resolver["foo"])
+        self.assertEqual(123, resolver.get("foo"))
+        self.assertIsNone(resolver.get("unknown"))
+
+    def test_resolver_should_forget_nodes_after_update(self):
+        resolver = self.repo.module_resolver
+        self.assertIn("repo1:other", resolver)
+        self.assertEqual(self.module, resolver["repo1:other"])
+
+        self.module._selected = False
+        self.repo._update()
+        self.assertNotIn("repo1:other", resolver)
+        self.assertRaises(le.LbuildResolverSearchException,
+                          lambda: resolver["repo1:other"])
+
+    def test_resolver_should_find_added_nodes(self):
+        resolver = self.module.option_value_resolver
+        self.assertNotIn("new", resolver)
+
+        self.module.add_child(NumericOption("new", "", default=1))
+        resolver = self.module.option_value_resolver
+        self.assertEqual(1, resolver["new"])
+        self.assertEqual(1, resolver["repo1:other:new"])
+
+    def test_resolver_should_see_added_nodes_when_reused(self):
+        module = lbuild.module.ModuleInit(self.repo, "./module.lb")
+        module.parent = self.repo.name
+        module.name = "second"
+        module.available = True
+        second, = lbuild.module.build_modules([module])
+
+        resolver = self.repo.option_value_resolver
+        self.assertEqual(456, resolver["::foo"])
+
+        second.add_child(NumericOption("foo", "", default=1))
+        with self.assertRaises(le.LbuildResolverAmbiguousMatchException):
+            resolver["::foo"]
+
+    def test_resolver_caches_should_be_released_with_tree(self):
+        self.assertEqual(456, self.module.option_value_resolver["foo"])
+        self.assertEqual(4, len(self.module.all_options()))
+
+        repo = weakref.ref(self.repo)
+        del self.repo, self.module, self.config, self.config2
+        gc.collect()
+        self.assertIsNone(repo())
+
+    def test_should_find_all_nodes_after_update(self):
+        self.assertEqual(4, len(self.module.all_options()))
+        self.assertEqual(1, len(self.repo.all_modules()))
+
+        self.module._selected = False
+        self.repo._update()
+        self.assertEqual(0, len(self.module.all_options()))
+        self.assertEqual(0, len(self.repo.all_modules()))
+        self.assertEqual(1, len(self.repo.all_modules(selected=False)))
+
     def test_should_create_correct_representation(self):
         resolver = self.module.option_value_resolver
         self.assertEqual(4, repr(resolver).count("Option("))
@@ -123,6 +185,14 @@ class ResolverTest(unittest.TestCase):
         with self.assertRaises(le.LbuildResolverAliasException):
             resolver["repo1:other:alias_wrong"]
 
+        # Membership tests must not raise for unresolvable destinations
+        self.module.add_child(Alias("alias_missing", "", destination="missing"))
+        resolver = self.module.option_value_resolver
+        self.assertNotIn("repo1:other:alias_missing", resolver)
+        self.assertIsNone(resolver.get("repo1:other:alias_missing"))
+        with self.assertRaises(le.LbuildResolverNoMatchException):
+            resolver["repo1:other:alias_missing"]
+
         logging.disable(logging.NOTSET)
 
     def test_should_resolve_config_value(self):